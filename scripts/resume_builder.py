@@ -7,10 +7,14 @@ Supports nested content blocks and individual line filtering.
 """
 
 import argparse
+import logging
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import AbstractSet, Callable, Dict, FrozenSet, Iterator, List, Match, Set, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class ResumeBuilder:
@@ -18,25 +22,46 @@ class ResumeBuilder:
     ResumeBuilder class for processing LaTeX files and filtering content based on role tags.
     Supports nested content blocks and individual line filtering.
     """
+    # Precompiled patterns used on every processing call
+    # Leftover inline tags, or a highlights env holding only whitespace/comment lines
+    # (matched one line at a time so it can't backtrack exponentially)
+    _FINAL_CLEANUP_RE = re.compile(
+        r'\\rolecontent\{[^}]+\}\{[^}]*\}'
+        r'|\\begin\{highlights\}(?:[^\S\n]*(?:%.*)?\n)*[^\S\n]*(?:%.*)?\\end\{highlights\}'
+    )
+    _SIMPLE_ROLECONTENT_START_RE = re.compile(r'\\rolecontent\{([^}]+)\}\{') # start of \rolecontent{roles}{
+    _EXCLUDE_START_RE = re.compile(r'\\exclude\{') # start of \exclude{
+    # Structural tags that drive the line state machine, in order of precedence
+    _LINE_TAG_RE = re.compile(
+        r'\\begin\{(?:(?P<exclude_start>exclude\})|(?P<role_start>rolecontent\}\{(?P<roles>[^}]+)\}))'
+        r'|\\end\{(?:(?P<exclude_end>exclude\})|(?P<role_end>rolecontent\}))'
+    )
+    _LINE_TAG_PRECEDENCE = ('exclude_start', 'exclude_end', 'role_start', 'role_end')
+    # Any tag that makes a line need per-line processing
+    _TAG_LINE_RE = re.compile(r'\\(?:(?:begin|end)\{(?:exclude|rolecontent)\}|exclude\{|rolecontent\{)')
+    
     def __init__(self, source_dir: str, output_dir: str, roles: List[str], include_location: bool = False, include_languages: bool = False):
         self.source_dir = Path(source_dir) # source directory containing LaTeX files
         self.output_dir = Path(output_dir) # output directory for processed files - NEW LaTeX files will be written here
-        self.roles = set(roles) # set of roles to build resumes for
+        self.roles = {sys.intern(role) for role in roles} # set of roles to build resumes for (interned)
         self.current_role = None # current role being processed
         self.include_location = include_location # whether to include location in header
         self.include_languages = include_languages # whether to include languages in skills section
+        self._role_cache = {} # parsed role lists keyed by the raw comma-separated string
         
         # Tag patterns
         self.start_tag_pattern = re.compile(r'\\begin\{rolecontent\}\{([^}]+)\}') # pattern matches \begin{rolecontent}{roles}
-        self.end_tag_pattern = re.compile(r'\\end\{rolecontent\}')
         self.inline_tag_pattern = re.compile(r'\\rolecontent\{([^}]+)\}\{([^}]*)\}') # pattern matches \rolecontent{roles}{content}
         self.exclude_tag_pattern = re.compile(r'\\exclude\{([^}]*)\}') # pattern matches \exclude{content}
-        self.exclude_start_pattern = re.compile(r'\\begin\{exclude\}') # pattern matches \begin{exclude}
-        self.exclude_end_pattern = re.compile(r'\\end\{exclude\}') # pattern matches \end{exclude}
         
-    def parse_role_list(self, role_string: str) -> Set[str]:
+    def parse_role_list(self, role_string: str) -> FrozenSet[str]:
         """Parse comma-separated role list and return set of roles."""
-        return {role.strip() for role in role_string.split(',')}
+        # The same role strings repeat throughout a document, so memoize them
+        roles = self._role_cache.get(role_string)
+        if roles is None:
+            roles = frozenset(sys.intern(role.strip()) for role in role_string.split(','))
+            self._role_cache[role_string] = roles
+        return roles
     
     def discover_all_tags(self) -> Set[str]:
         """Discover all role tags used in the LaTeX files."""
@@ -62,46 +87,78 @@ class ResumeBuilder:
     
     def remove_nested_exclude_tags(self, line: str) -> str:
         r"""Remove \exclude{...} tags, handling nested braces properly."""
-        result = line
+        parts = []
+        pos = 0
         while True:
-            # Find the start of an exclude tag
-            start_match = re.search(r'\\exclude\{', result)
+            # Find the start of the next exclude tag after what has been kept so far
+            start_match = self._EXCLUDE_START_RE.search(line, pos)
             if not start_match:
                 break
             
-            start_pos = start_match.start()
-            
             # Find the matching closing brace by counting braces
-            brace_count = 1
-            content_start = start_match.end()
-            content_end = content_start
+            content_end = self.find_closing_brace(line, start_match.end(), len(line))
             
-            for i, char in enumerate(result[content_start:], content_start):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        content_end = i
-                        break
-            
-            if brace_count == 0:
-                # Found matching closing brace, remove the entire tag
-                result = result[:start_pos] + result[content_end + 1:]
-            else:
-                # No matching closing brace found, skip this tag
+            if content_end == -1:
+                # No matching closing brace found, keep the rest as is
                 break
+            
+            # Found matching closing brace, drop the entire tag
+            parts.append(line[pos:start_match.start()])
+            pos = content_end + 1
         
-        return result
+        if not parts:
+            return line
+        parts.append(line[pos:])
+        return ''.join(parts)
     
-    def should_include_content(self, content_roles: Set[str]) -> bool:
+    def find_closing_brace(self, text: str, start: int, end: int) -> int:
+        """Return the index of the brace closing one already open before start, or -1 if it is not found before end."""
+        depth = 1
+        pos = start
+        next_open = text.find('{', pos, end)
+        while True:
+            next_close = text.find('}', pos, end)
+            if next_close == -1:
+                return -1
+            # Skip over nested opening braces found before the next closing brace
+            while next_open != -1 and next_open < next_close:
+                depth += 1
+                next_open = text.find('{', next_open + 1, end)
+            depth -= 1
+            if depth == 0:
+                return next_close
+            pos = next_close + 1
+    
+    def find_line_tag(self, line: str) -> Optional[Match]:
+        """Return the structural tag on a line that takes precedence, or None if there is none."""
+        tag_match = self._LINE_TAG_RE.search(line)
+        if not tag_match:
+            return None
+        next_match = self._LINE_TAG_RE.search(line, tag_match.end())
+        if not next_match:
+            return tag_match
+        # Several tags on one line: exclude start/end win over rolecontent start/end.
+        # Reuse the two matches already found and only scan the rest of the line.
+        matches = [tag_match, next_match]
+        matches.extend(self._LINE_TAG_RE.finditer(line, next_match.end()))
+        return min(matches, key=lambda m: self._LINE_TAG_PRECEDENCE.index(m.lastgroup))
+    
+    def should_include_content(self, content_roles: AbstractSet[str]) -> bool:
         """Check if content should be included for current role."""
-        if not content_roles:  # No tags = include for all roles
-            return True
-        return bool(content_roles & {self.current_role})
+        # No tags = include for all roles
+        return (not content_roles) or (self.current_role in content_roles)
+    
+    def make_role_filter(self) -> Callable[[AbstractSet[str]], bool]:
+        """Return should_include_content specialized to the current role, for binding as a local in hot loops."""
+        role = self.current_role
+        return lambda content_roles: (not content_roles) or (role in content_roles)
     
     def process_line(self, line: str) -> Optional[str]:
         """Process a single line and return filtered content."""
+        # Most lines carry no inline tags at all; a substring check is far cheaper than the regex path
+        if '\\exclude{' not in line and '\\rolecontent{' not in line:
+            return line
+        
         # Check for exclude tags - handle nested braces properly
         stripped = line.strip()
         
@@ -128,182 +185,168 @@ class ResumeBuilder:
     
     def process_simple_rolecontent_tags(self, line: str) -> Optional[str]:
         """Process simple single-line rolecontent tags."""
-        # Find all rolecontent tags in the line
-        result = line
+        result = '\n'.join(self.iter_expanded_lines(line, strip_indent=False))
+        return result if result.strip() else None
+    
+    def iter_expanded_lines(self, text: str, strip_indent: bool = True) -> Iterator[str]:
+        r"""
+        Yield the lines of text with \rolecontent{roles}{content} tags replaced by their content or nothing.
+        Consecutive lines between tags come out as one newline-joined run instead of one at a time.
+        Works in one forward pass; tags nested inside included content are expanded as they are reached.
+        """
+        line_parts = []  # fragments of the output line being built
+        pos = 0
+        closers = []  # closing-brace positions of included tags, innermost last
+        should_include = self.make_role_filter()
         while True:
-            # Find the start of a rolecontent tag
-            start_match = re.search(r'\\rolecontent\{([^}]+)\}\{', result)
-            if not start_match:
-                break
-            
-            start_pos = start_match.start()
-            roles_str = start_match.group(1)
-            
-            # Find the matching closing brace by counting braces
-            brace_count = 0
-            content_start = result.find('{', start_pos) + 1
-            content_end = content_start
+            limit = closers[-1] if closers else len(text)
+            start_match = self._SIMPLE_ROLECONTENT_START_RE.search(text, pos, limit)
+            chunk = text[pos:start_match.start() if start_match else limit]
+            first_newline = chunk.find('\n')
+            if first_newline != -1:
+                last_newline = chunk.rfind('\n')
+                line_parts.append(chunk[:first_newline])
+                yield ''.join(line_parts)
+                if last_newline > first_newline:
+                    yield chunk[first_newline + 1:last_newline]
+                line_parts = [chunk[last_newline + 1:]]
+            else:
+                line_parts.append(chunk)
             
-            for i, char in enumerate(result[content_start:], content_start):
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    if brace_count == 0:
-                        content_end = i
-                        break
-                    brace_count -= 1
+            if not start_match:
+                if not closers:
+                    break
+                pos = closers.pop() + 1  # skip the closing brace of the included tag
+                continue
             
-            if content_end == content_start:
-                # No closing brace found, skip this tag
-                break
+            # Indentation in front of a tag at the start of a line goes with the tag
+            if strip_indent and not ''.join(line_parts).strip(' \t'):
+                line_parts = []
             
-            # Extract the content and roles
-            content = result[content_start:content_end]
-            content_roles = self.parse_role_list(roles_str)
+            # Find the matching closing brace for the content; i is just past it
+            closing = self.find_closing_brace(text, start_match.end(), limit)
+            i = closing + 1 if closing != -1 else limit
             
-            # Replace the tag with content or remove it
-            if self.should_include_content(content_roles):
-                # Replace the entire tag with just the content
-                tag_start = result.find('\\rolecontent{', start_pos)
-                result = result[:tag_start] + content + result[content_end + 1:]
+            if should_include(self.parse_role_list(start_match.group(1))):
+                # Keep scanning inside the content; without a closing brace the last character is dropped
+                if i - 1 >= start_match.end():
+                    closers.append(i - 1)
+                    pos = start_match.end()
+                else:
+                    pos = i
             else:
-                # Remove the entire tag
-                tag_start = result.find('\\rolecontent{', start_pos)
-                result = result[:tag_start] + result[content_end + 1:]
+                pos = i
         
-        return result if result.strip() else None
+        yield ''.join(line_parts)
     
     def process_file(self, input_file: Path, output_file: Path) -> None:
         """Process a single LaTeX file and write filtered output."""
-        print(f"Processing {input_file} -> {output_file}")
-        
-        with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        logger.info("Processing %s -> %s", input_file, output_file)
         
         # Process the content
-        processed_content = self.process_content(content)
+        processed_content = self.process_content(input_file.read_text(encoding='utf-8'))
         
-        # Write output
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(processed_content)
+        # Write output (the caller creates the output directory)
+        output_file.write_text(processed_content, encoding='utf-8')
     
     def process_multiline_rolecontent(self, content: str) -> str:
         """Process rolecontent tags that span multiple lines."""
-        # Use a regex to match from the start of the line, including whitespace
-        pattern = re.compile(
-            r'(^[ \t]*)?\\rolecontent\{([^}]+)\}\{', re.MULTILINE
-        )
-        result = content
-        while True:
-            start_match = pattern.search(result)
-            if not start_match:
-                break
-            start_pos = start_match.start()
-            leading_ws = start_match.group(1) or ''
-            roles_str = start_match.group(2)
-            
-            # Find the matching closing brace for the content
-            brace_count = 1
-            i = start_match.end()
-            while i < len(result) and brace_count > 0:
-                if result[i] == '{':
-                    brace_count += 1
-                elif result[i] == '}':
-                    brace_count -= 1
-                i += 1
-            
-            content_inside = result[start_match.end():i-1]
-            should_include = self.should_include_content(self.parse_role_list(roles_str))
-            
-            if should_include:
-                replacement = content_inside
-            else:
-                replacement = ''
-            
-            # Replace from start_pos to i (end of closing brace)
-            result = result[:start_pos] + replacement + result[i:]
-        
-        return result
+        return '\n'.join(self.iter_expanded_lines(content))
+    
+    def iter_tagged_lines(self, content: str) -> Iterator[Tuple[str, bool]]:
+        """
+        Yield (text, tagged) pairs covering the expanded content line by line.
+        Lines that may hold a tag come out one at a time; untagged lines in between come out as one run.
+        """
+        for run in self.iter_expanded_lines(content):
+            pos = 0
+            for tag_match in self._TAG_LINE_RE.finditer(run):
+                if tag_match.start() < pos:
+                    continue  # another tag on a line already yielded
+                line_start = run.rfind('\n', 0, tag_match.start()) + 1
+                line_end = run.find('\n', tag_match.end())
+                if line_end == -1:
+                    line_end = len(run)
+                if line_start > pos:
+                    yield run[pos:line_start - 1], False
+                yield run[line_start:line_end], True
+                pos = line_end + 1
+            if pos <= len(run):
+                yield run[pos:], False
     
     def process_content(self, content: str) -> str:
         """Process content with role-based filtering."""
-        # First, process multi-line rolecontent tags
-        content = self.process_multiline_rolecontent(content)
-        lines = content.split('\n')
+        # Multi-line rolecontent tags are expanded as the lines are consumed
         processed_lines = []
         in_role_block = False
         in_exclude_block = False
         current_block_roles = set()
         block_content = []
-        for line in lines:
+        # Bind the per-line methods once; attribute lookups dominate this loop
+        find_line_tag = self.find_line_tag
+        process_line = self.process_line
+        should_include = self.make_role_filter()
+        for line, tagged in self.iter_tagged_lines(content):
+            # Untagged lines come through unchanged, possibly several at once
+            if not tagged:
+                if not in_exclude_block:
+                    (block_content if in_role_block else processed_lines).append(line)
+                continue
+            tag_match = find_line_tag(line)
+            tag = tag_match.lastgroup if tag_match else None
             # Check for start of exclude block
-            if self.exclude_start_pattern.search(line):
+            if tag == 'exclude_start':
                 in_exclude_block = True
                 continue
             # Check for end of exclude block
-            if self.exclude_end_pattern.search(line):
+            if tag == 'exclude_end':
                 in_exclude_block = False
                 continue
             # Skip lines if we're in an exclude block
             if in_exclude_block:
                 continue
             # Check for start of rolecontent block
-            start_match = self.start_tag_pattern.search(line)
-            if start_match:
+            if tag == 'role_start':
                 in_role_block = True
-                roles_str = start_match.group(1)
-                current_block_roles = self.parse_role_list(roles_str)
+                current_block_roles = self.parse_role_list(tag_match.group('roles'))
                 continue
             # Check for end of rolecontent block
-            if self.end_tag_pattern.search(line):
+            if tag == 'role_end':
                 in_role_block = False
-                if self.should_include_content(current_block_roles):
+                if should_include(current_block_roles):
                     processed_lines.extend(block_content)
                 block_content = []
                 current_block_roles = set()
                 continue
             # If we're in a role block, collect content but also process inline tags
-            if in_role_block:
-                processed_line = self.process_line(line)
-                if processed_line is not None:
-                    block_content.append(processed_line)
-            else:
-                processed_line = self.process_line(line)
-                if processed_line is not None:
-                    processed_lines.append(processed_line)
+            processed_line = process_line(line)
+            if processed_line is not None:
+                (block_content if in_role_block else processed_lines).append(processed_line)
         # Join lines and do a final pass to clean up any remaining inline tags
         result = '\n'.join(processed_lines)
-        # Final cleanup: remove any remaining inline tags that weren't processed
-        result = self.inline_tag_pattern.sub('', result)
-        result = self.remove_nested_exclude_tags(result)
-        # Remove empty highlights environments (no \item inside)
-        result = re.sub(
-            r'\\begin\{highlights\}\s*\\end\{highlights\}',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        # Remove highlights environments that only contain whitespace/comments/newlines
-        result = re.sub(
-            r'\\begin\{highlights\}([\s%]*)\\end\{highlights\}',
-            '',
-            result,
-            flags=re.DOTALL
-        )
-        # Remove highlights environments that contain only whitespace or comments (no \item)
-        result = re.sub(
-            r'\\begin\{highlights\}((?:\s|%.*|\n)*)\\end\{highlights\}',
-            '',
-            result,
-            flags=re.DOTALL
-        )
+        # Final cleanup: remove exclude tags, then any remaining inline tags and
+        # highlights environments that contain only whitespace or comments (no \item)
+        # in one scan, repeating only if a removal may have emptied a highlights block.
+        # Each pass is skipped when none of its tags appear in the result at all.
+        if '\\exclude{' in result:
+            result = self.remove_nested_exclude_tags(result)
+        removed = '\\begin{highlights}' in result or '\\rolecontent{' in result
+        while removed:
+            result, removed = self._FINAL_CLEANUP_RE.subn('', result)
         return result
     
+    def process_content_for_role(self, content: str, role: str) -> str:
+        """Process already-loaded content with role-based filtering for the given role."""
+        self.current_role = sys.intern(role)
+        return self.process_content(content)
+    
     def build_for_role(self, role: str) -> None:
         """Build resume for a specific role."""
-        self.current_role = role
-        print(f"\nBuilding resume for role: {role}")
+        self.current_role = sys.intern(role)
+        logger.info("\nBuilding resume for role: %s", role)
+        
+        # Create output directory once for all files
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Copy all source files to output directory
         for tex_file in self.source_dir.glob('*.tex'):
@@ -314,11 +357,7 @@ class ResumeBuilder:
         style_file = self.source_dir.parent / 'templates' / 'resume-layout.sty'
         if style_file.exists():
             output_style = self.output_dir / 'resume-layout.sty'
-            output_style.parent.mkdir(parents=True, exist_ok=True)
-            with open(style_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            with open(output_style, 'w', encoding='utf-8') as f:
-                f.write(content)
+            output_style.write_bytes(style_file.read_bytes())
         
         # Create role definition file
         role_def_file = self.output_dir / 'role-def.tex'
@@ -327,36 +366,68 @@ class ResumeBuilder:
             f.write(f'\\def\\includelocation{{{str(self.include_location).lower()}}}\n')
             f.write(f'\\def\\includelanguages{{{str(self.include_languages).lower()}}}\n')
     
-    def build_all(self) -> None:
-        """Build resumes for all roles."""
+    def build_all(self, jobs: int = 1) -> None:
+        """Build resumes for all roles, optionally building several roles in parallel processes."""
+        # Read every source file once; only the filtering depends on the role
+        sources = {
+            tex_file.name: tex_file.read_text(encoding='utf-8')
+            for tex_file in self.source_dir.glob('*.tex')
+        }
+        
+        # Read style file once and write its bytes unchanged to each role directory
+        style_file = self.source_dir.parent / 'templates' / 'resume-layout.sty'
+        style_content = style_file.read_bytes() if style_file.exists() else None
+        
+        if jobs > 1 and len(self.roles) > 1:
+            # Roles are independent, so each worker gets its own builder and the already-read sources
+            builder_args = (self.source_dir, self.output_dir, [], self.include_location, self.include_languages)
+            log_level = logging.getLogger().getEffectiveLevel()
+            tasks = [(builder_args, log_level, role, sources, style_content) for role in self.roles]
+            with ProcessPoolExecutor(max_workers=min(jobs, len(self.roles))) as executor:
+                list(executor.map(_build_one_role, tasks))
+            return
+        
         for role in self.roles:
-            print(f"\nBuilding resume for role: {role}")
-            self.current_role = role
-            
-            # Create role-specific output directory
-            role_output_dir = self.output_dir / role
-            role_output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Copy all source files to role-specific output directory
-            for tex_file in self.source_dir.glob('*.tex'):
-                output_file = role_output_dir / tex_file.name
-                self.process_file(tex_file, output_file)
-            
-            # Copy style file
-            style_file = self.source_dir.parent / 'templates' / 'resume-layout.sty'
-            if style_file.exists():
-                output_style = role_output_dir / 'resume-layout.sty'
-                with open(style_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(output_style, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            
-            # Create role definition file
-            role_def_file = role_output_dir / 'role-def.tex'
-            with open(role_def_file, 'w', encoding='utf-8') as f:
-                f.write(f'\\def\\buildrole{{{role}}}\n')
-                f.write(f'\\def\\includelocation{{{str(self.include_location).lower()}}}\n')
-                f.write(f'\\def\\includelanguages{{{str(self.include_languages).lower()}}}\n')
+            self.build_role_from_sources(role, sources, style_content)
+    
+    def build_role_from_sources(self, role: str, sources: Dict[str, str], style_content: Optional[bytes]) -> None:
+        """Write the filtered output for one role into its own subdirectory from already-read sources."""
+        logger.info("\nBuilding resume for role: %s", role)
+        
+        # Create role-specific output directory
+        role_output_dir = self.output_dir / role
+        role_output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Write processed source files to role-specific output directory
+        for name, raw in sources.items():
+            output_file = role_output_dir / name
+            logger.info("Processing %s -> %s", self.source_dir / name, output_file)
+            output_file.write_text(self.process_content_for_role(raw, role), encoding='utf-8')
+        
+        # Copy style file
+        if style_content is not None:
+            output_style = role_output_dir / 'resume-layout.sty'
+            output_style.write_bytes(style_content)
+        
+        # Create role definition file
+        role_def_file = role_output_dir / 'role-def.tex'
+        with open(role_def_file, 'w', encoding='utf-8') as f:
+            f.write(f'\\def\\buildrole{{{role}}}\n')
+            f.write(f'\\def\\includelocation{{{str(self.include_location).lower()}}}\n')
+            f.write(f'\\def\\includelanguages{{{str(self.include_languages).lower()}}}\n')
+
+
+def _build_one_role(task: Tuple[tuple, int, str, Dict[str, str], Optional[bytes]]) -> None:
+    """Build a single role in a worker process (module-level so it can be pickled)."""
+    builder_args, log_level, role, sources, style_content = task
+    # Spawned workers start without the parent's logging setup
+    configure_logging(log_level)
+    ResumeBuilder(*builder_args).build_role_from_sources(role, sources, style_content)
+
+
+def configure_logging(level: int) -> None:
+    """Send progress messages to stdout as plain lines at the given level."""
+    logging.basicConfig(level=level, format='%(message)s', stream=sys.stdout)
 
 
 def main() -> None:
@@ -375,8 +446,13 @@ def main() -> None:
                        help='Automatically discover all tags used in LaTeX files and build for all of them')
     parser.add_argument('--list-tags', action='store_true',
                        help='List all tags discovered in LaTeX files and exit')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of roles to build in parallel processes')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only report warnings and errors, not per-file progress')
     
     args = parser.parse_args()
+    configure_logging(logging.WARNING if args.quiet else logging.INFO)
     
     # If --role is specified, override --roles to contain only that role
     if args.role:
@@ -386,7 +462,7 @@ def main() -> None:
         temp_builder = ResumeBuilder(args.source_dir, args.output_dir, [], args.include_location, args.include_languages)
         discovered_tags = temp_builder.discover_all_tags()
         args.roles = sorted(list(discovered_tags))
-        print(f"Auto-discovered tags: {', '.join(args.roles)}")
+        logger.info("Auto-discovered tags: %s", ', '.join(args.roles))
     
     # If --list-tags is specified, just list tags and exit
     if args.list_tags:
@@ -402,7 +478,7 @@ def main() -> None:
     if args.role:
         builder.build_for_role(args.role)
     else:
-        builder.build_all()
+        builder.build_all(jobs=args.jobs)
 
 
 if __name__ == '__main__':